@@ -1,10 +1,16 @@
 import streamlit as st
-import base64
+import streamlit.components.v1 as components
+import binascii
+import logging
+import orjson
 import os
-import json
-import wave
+import socket
+import struct
+import threading
+import uuid
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from pydub import AudioSegment
 
 # Page configuration for better accessibility
 st.set_page_config(
@@ -14,81 +20,279 @@ st.set_page_config(
     initial_sidebar_state="expanded",
 )
 
-# Custom CSS for better accessibility
-st.markdown("""
+@st.cache_resource
+def inject_css():
+    """Custom CSS for better accessibility, built once per server process"""
+    return """
 <style>
-    .main-header {
-        font-size: 2.5rem;
-        margin-bottom: 1rem;
-    }
-    .subheader {
-        font-size: 1.5rem;
-        margin-top: 1rem;
-        margin-bottom: 0.5rem;
-    }
-    .file-info {
-        background-color: #f0f2f6;
-        padding: 10px;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
     .stButton button {
         width: 100%;
         height: 3rem;
         font-size: 1.2rem;
         font-weight: bold;
     }
-    .download-button {
-        margin-top: 10px;
-    }
-    .error-message {
-        background-color: #ffebee;
-        color: #c62828;
-        padding: 10px;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
-    .success-message {
-        background-color: #e8f5e9;
-        color: #2e7d32;
-        padding: 10px;
-        border-radius: 5px;
-        margin: 10px 0;
-    }
     /* Improve focus indicators for keyboard navigation */
     *:focus {
         outline: 3px solid #4299e1 !important;
         outline-offset: 2px !important;
     }
 </style>
-""", unsafe_allow_html=True)
+"""
+
+# Base64 characters decoded per block (multiple of 4 -> whole bytes per block)
+PCM_CHUNK_CHARS = 65536 * 4
+
+# Returns immutable bytes like the builders below, so the cached object is shared as-is
+@st.cache_resource(show_spinner=False, max_entries=16)
+def decode_pcm(base64_string):
+    """Decode the base64 audio string from the Sarvam TTS API response"""
+    # Reject garbage before copying or allocating anything payload-sized
+    if not binascii.a2b_base64(base64_string.lstrip()[:8]).startswith(b'RIFF'):
+        raise ValueError("Audio data is not a base64-encoded WAV file")
+    
+    # Whitespace (line wrapping, a trailing newline) is not part of the encoding
+    data = "".join(base64_string.split())
+    if len(data) % 4 != 0:
+        raise ValueError("Audio data is not valid base64 (length is not a multiple of 4)")
+    
+    # The decoded size is known up front, so allocate once and decode block by block into it
+    padding = len(data) - len(data.rstrip("="))
+    if padding > 2:
+        raise ValueError("Audio data is not valid base64 (unexpected characters)")
+    pcm = bytearray(len(data) * 3 // 4 - padding)
+    view = memoryview(pcm)
+    offset = 0
+    for i in range(0, len(data), PCM_CHUNK_CHARS):
+        chunk = binascii.a2b_base64(data[i:i + PCM_CHUNK_CHARS])
+        view[offset:offset + len(chunk)] = chunk
+        offset += len(chunk)
+    
+    del view
+    # Stray non-alphabet characters are dropped by the decoder and leave the buffer short
+    if offset != len(pcm):
+        raise ValueError("Audio data is not valid base64 (unexpected characters)")
+    # Cache arguments must be hashable, and the payload is shared across sessions, so freeze it
+    return bytes(pcm)
+
+def wav_header(n_bytes):
+    """Build the 44-byte RIFF/WAVE header for mono 16-bit 22050 Hz PCM"""
+    # A single pack beats patching a precomputed template (copy + pack_into), so build it directly
+    return struct.pack(
+        '<4sI4s4sIHHIIHH4sI',
+        b'RIFF', 36 + n_bytes, b'WAVE',
+        b'fmt ', 16, 1, 1, 22050, 22050 * 2, 2, 16,
+        b'data', n_bytes,
+    )
+
+def wav_parts(audio):
+    """Split the decoded Sarvam payload into the WAV header and PCM served for download and preview"""
+    # Mono audio, 2 bytes per sample, sample rate of 22050 Hz
+    pcm = wav_data(audio)
+    return wav_header(len(pcm)), pcm
+
+def wav_data(audio):
+    """Locate the PCM data chunk of a decoded Sarvam WAV payload"""
+    view = memoryview(audio)
+    if bytes(view[:4]) != b'RIFF' or bytes(view[8:12]) != b'WAVE':
+        raise ValueError("Audio data is not a WAV file")
+    
+    # Walk the RIFF chunks; the fmt chunk must match what the encoders are configured for
+    fmt = None
+    offset = 12
+    while offset + 8 <= len(view):
+        chunk_id, size = struct.unpack_from('<4sI', view, offset)
+        body = offset + 8
+        if chunk_id == b'fmt ':
+            if size < 16 or body + 16 > len(view):
+                raise ValueError("Audio data must be 22050 Hz mono 16-bit PCM WAV")
+            audio_format, channels, rate, _, _, bits = struct.unpack_from('<HHIIHH', view, body)
+            fmt = (audio_format, channels, rate, bits)
+        elif chunk_id == b'data':
+            if fmt != (1, 1, 22050, 16):
+                raise ValueError("Audio data must be 22050 Hz mono 16-bit PCM WAV")
+            # Clamp to the bytes actually present and to whole 16-bit samples
+            size = min(size, len(view) - body) & ~1
+            return view[body:body + size]
+        offset = body + size + (size & 1)
+    raise ValueError("WAV payload has no data chunk")
+
+# The builders return immutable bytes, so cache_resource hands out the cached object as-is
+# instead of unpickling a fresh copy on every hit the way cache_data would
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_wav(audio):
+    """Rewrap the PCM of the decoded Sarvam WAV payload under a fresh header"""
+    return b"".join(wav_parts(audio))
+
+@st.cache_resource(show_spinner=False, max_entries=16)
+def build_mp3(audio):
+    """Encode the decoded Sarvam WAV payload to MP3 in-process with LAME"""
+    # The payload is already a WAV file; feed LAME only the 22050 Hz mono 16-bit data chunk
+    pcm_bytes = bytes(wav_data(audio))
+    
+    encoder = new_mp3_encoder()
+    return bytes(encoder.encode(pcm_bytes) + encoder.flush())
+
+def new_mp3_encoder():
+    """Create a LAME encoder for 22050 Hz mono 16-bit PCM at 128 kbps"""
+    # Imported here so WAV-only sessions never load the encoder
+    import lameenc
+    encoder = lameenc.Encoder()
+    encoder.set_bit_rate(128)
+    encoder.set_in_sample_rate(22050)
+    encoder.set_channels(1)
+    encoder.set_quality(2)
+    return encoder
+
+# Streaming previews are opt-in: AUDIO_SERVER_URL is the address browsers use to reach the server
+AUDIO_SERVER_URL = os.environ.get("AUDIO_SERVER_URL", "").rstrip("/")
+AUDIO_SERVER_HOST = os.environ.get("AUDIO_SERVER_HOST", "127.0.0.1")
+AUDIO_SERVER_PORT = int(os.environ.get("AUDIO_SERVER_PORT", "8502"))
+
+# PCM bytes per streamed block: a quarter second of audio, roughly 4 KB of 128 kbps MP3
+STREAM_PCM_BLOCK = 22050 // 4 * 2
+
+# Oldest payloads are dropped once this many are registered for streaming
+MAX_STREAMED_AUDIOS = 32
+
+def iter_wav_stream(audio, start=0, stop=None):
+    """Yield bytes [start, stop) of the same WAV file as build_wav in fixed-size blocks"""
+    header, pcm = wav_parts(audio)
+    parts = (memoryview(header), pcm)
+    stop = len(header) + len(pcm) if stop is None else stop
+    offset = 0
+    for part in parts:
+        # Clip the requested span to this part, in the part's own offsets
+        lo, hi = max(start - offset, 0), min(stop - offset, len(part))
+        for i in range(lo, hi, STREAM_PCM_BLOCK):
+            yield bytes(part[i:min(i + STREAM_PCM_BLOCK, hi)])
+        offset += len(part)
+
+def parse_range(range_header, total):
+    """Turn a single 'bytes=' Range header into a [start, stop) span; None means serve it all"""
+    if not range_header or not range_header.startswith("bytes=") or "," in range_header:
+        return None
+    first, _, last = range_header[len("bytes="):].strip().partition("-")
+    try:
+        if first:
+            start, stop = int(first), int(last) + 1 if last else total
+        else:
+            # Suffix form 'bytes=-N' asks for the final N bytes
+            start, stop = total - int(last), total
+    except ValueError:
+        return None
+    return max(start, 0), min(stop, total)
+
+def wav_response(audio, range_header):
+    """Serve the WAV preview with its length up front and byte ranges for seeking"""
+    from fastapi.responses import Response, StreamingResponse
+    
+    header, pcm = wav_parts(audio)
+    total = len(header) + len(pcm)
+    span = parse_range(range_header, total)
+    if span is None:
+        return StreamingResponse(
+            iter_wav_stream(audio), media_type="audio/wav",
+            headers={"Content-Length": str(total), "Accept-Ranges": "bytes"},
+        )
+    start, stop = span
+    if start >= stop:
+        return Response(status_code=416, headers={"Content-Range": f"bytes */{total}"})
+    return StreamingResponse(
+        iter_wav_stream(audio, start, stop), status_code=206, media_type="audio/wav",
+        headers={
+            "Content-Length": str(stop - start),
+            "Content-Range": f"bytes {start}-{stop - 1}/{total}",
+            "Accept-Ranges": "bytes",
+        },
+    )
 
-# Create output directory if it doesn't exist
-if not os.path.exists('audio_files'):
-    os.makedirs('audio_files')
+def iter_mp3_stream(audio):
+    """Yield MP3 frames for the decoded Sarvam payload as they are encoded"""
+    pcm = wav_data(audio)
+    encoder = new_mp3_encoder()
+    for i in range(0, len(pcm), STREAM_PCM_BLOCK):
+        frames = encoder.encode(bytes(pcm[i:i + STREAM_PCM_BLOCK]))
+        if frames:
+            yield bytes(frames)
+    yield bytes(encoder.flush())
 
-def save_audio_tts_method(base64_string, filename):
-    """Save base64 string as WAV file - exactly as in Sarvam TTS API response handling"""
-    # Decode the base64-encoded audio data
-    audio = base64.b64decode(base64_string)
+def build_audio_app(store):
+    """FastAPI app serving the payloads in store as WAV and MP3 previews"""
+    from fastapi import FastAPI, HTTPException, Request
+    from fastapi.responses import StreamingResponse
+    
+    app = FastAPI()
+    
+    @app.get("/audio/{audio_id}.{extension}")
+    def stream_audio(audio_id: str, extension: str, request: Request):
+        audio = store.get(audio_id)
+        if audio is None or extension not in ("wav", "mp3"):
+            raise HTTPException(status_code=404)
+        if extension == "wav":
+            return wav_response(audio, request.headers.get("range"))
+        # The MP3 is encoded while it is sent, so its length is unknown and it cannot seek
+        return StreamingResponse(iter_mp3_stream(audio), media_type="audio/mpeg", headers={"Accept-Ranges": "none"})
+    
+    return app
+
+@st.cache_resource
+def audio_server():
+    """Start the background server that streams previews, returning its payload store or None"""
+    if not AUDIO_SERVER_URL:
+        return None
+    
+    # Bind here so a taken port is reported and previews fall back to inline players
+    try:
+        sock = socket.create_server((AUDIO_SERVER_HOST, AUDIO_SERVER_PORT))
+    except OSError as e:
+        logging.getLogger(__name__).warning(
+            "Audio server could not bind %s:%s (%s); using inline players", AUDIO_SERVER_HOST, AUDIO_SERVER_PORT, e
+        )
+        return None
+    
+    import uvicorn
     
-    # Save the audio as a .wav file
-    with wave.open(filename, "wb") as wav_file:
-        # Set the parameters for the .wav file
-        wav_file.setnchannels(1)  # Mono audio
-        wav_file.setsampwidth(2)  # 2 bytes per sample
-        wav_file.setframerate(22050)  # Sample rate of 22050 Hz
+    store = OrderedDict()
+    server = uvicorn.Server(uvicorn.Config(build_audio_app(store), log_level="warning"))
+    # Signal handlers can only be installed from the main thread, which belongs to Streamlit
+    server.install_signal_handlers = lambda: None
+    threading.Thread(target=server.run, kwargs={"sockets": [sock]}, name="audio-server", daemon=True).start()
+    return store
 
-        # Write the audio data to the file
-        wav_file.writeframes(audio)
+def register_stream(store, audio):
+    """Make a decoded payload available to the streaming server and return its id"""
+    # Ids are random and unguessable, so a preview URL only reaches the payload it was issued for
+    audio_id = uuid.uuid4().hex
+    store[audio_id] = audio
+    while len(store) > MAX_STREAMED_AUDIOS:
+        store.popitem(last=False)
+    return audio_id
+
+def preview_player(audio, data, extension, stream_ids, key):
+    """Play one converted file, streamed from the audio server when it is running"""
+    store = audio_server()
+    if store is None:
+        st.audio(data, format=f'audio/{extension}')
+        return
     
-    return filename
+    # Register on first preview only, and again if other conversions have since evicted it
+    audio_id = stream_ids.get(key)
+    if audio_id not in store:
+        audio_id = register_stream(store, audio)
+        stream_ids[key] = audio_id
+    stream_player(audio_id, extension)
+
+def stream_player(audio_id, extension):
+    """Embed a browser audio player fed by the streaming server"""
+    components.html(
+        f'<audio controls preload="none" style="width: 100%" src="{AUDIO_SERVER_URL}/audio/{audio_id}.{extension}"></audio>',
+        height=60,
+    )
 
-def convert_to_mp3(wav_file, mp3_file):
-    """Convert WAV file to MP3 format"""
-    sound = AudioSegment.from_wav(wav_file)
-    sound.export(mp3_file, format="mp3")
-    return mp3_file
+@st.cache_resource
+def conversion_pool():
+    """Long-lived worker threads shared by every session for WAV/MP3 builds"""
+    return ThreadPoolExecutor(max_workers=os.cpu_count() or 2, thread_name_prefix="audio-encode")
 
 def get_readable_file_size(size_in_bytes):
     """Convert bytes to human-readable file size"""
@@ -98,15 +302,58 @@ def get_readable_file_size(size_in_bytes):
         size_in_bytes /= 1024.0
     return f"{size_in_bytes:.1f} GB"
 
+def display_audio_files(audio, wav_bytes, mp3_bytes, output_format, base_filename, key, stream_ids):
+    """Render players and download buttons for one converted audio"""
+    # Create two columns for displaying files
+    col1, col2 = st.columns(2)
+    
+    # First column: WAV file (if WAV or Both is selected)
+    if output_format in ["WAV", "Both"]:
+        with col1:
+            st.subheader("WAV File")
+            
+            # Only embed the WAV player on request; it streams from the audio server when one is running
+            if st.checkbox("Preview WAV", key=f"wav_preview_{key}"):
+                preview_player(audio, wav_bytes, "wav", stream_ids, key)
+            
+            # Download button for WAV with accessible label
+            st.download_button(
+                label="📥 Download WAV File",
+                data=wav_bytes,
+                file_name=f"{base_filename}.wav",
+                mime="audio/wav",
+                key=f"wav_download_{key}",
+                help="Download the generated WAV file to your device"
+            )
+    
+    # Second column or first if only MP3 is selected: MP3 file
+    if output_format in ["MP3", "Both"]:
+        with col2 if output_format == "Both" else col1:
+            st.subheader("MP3 File")
+            
+            # Only embed the MP3 player on request; the audio server encodes it on the fly when running
+            if st.checkbox("Preview MP3", key=f"mp3_preview_{key}"):
+                preview_player(audio, mp3_bytes, "mp3", stream_ids, key)
+            
+            # Download button for MP3 with accessible label
+            st.download_button(
+                label="📥 Download MP3 File",
+                data=mp3_bytes,
+                file_name=f"{base_filename}.mp3",
+                mime="audio/mp3",
+                key=f"mp3_download_{key}",
+                help="Download the generated MP3 file to your device"
+            )
+
 def main():
-    # Main header with screen reader friendly markup
-    st.markdown('<h1 class="main-header">Base64 Audio Converter</h1>', unsafe_allow_html=True)
-    st.markdown("""
-    <p aria-live="polite">
-        Convert Sarvam TTS API base64 output to WAV or MP3 files. 
-        This tool processes the JSON response from Sarvam's TTS API and extracts audio data.
-    </p>
-    """, unsafe_allow_html=True)
+    # Single style injection per run; everything else uses native elements
+    st.markdown(inject_css(), unsafe_allow_html=True)
+    
+    st.title("Base64 Audio Converter")
+    st.markdown(
+        "Convert Sarvam TTS API base64 output to WAV or MP3 files. "
+        "This tool processes the JSON response from Sarvam's TTS API and extracts audio data."
+    )
     
     # Sample input with single audio string matching Sarvam TTS API format
     sample_input = {
@@ -127,15 +374,14 @@ def main():
     # Input area for JSON with sample
     json_input = st.text_area(
         "Paste Sarvam TTS API response here", 
-        json.dumps(sample_input, indent=2),
+        orjson.dumps(sample_input, option=orjson.OPT_INDENT_2).decode(),
         height=200,
         help="Paste the JSON response from Sarvam's TTS API here. It should contain a 'request_id' and 'audios' array."
     )
     
-    # Format selection with accessibility labels
-    st.markdown('<p id="format-label">Select output format:</p>', unsafe_allow_html=True)
+    # Format selection; the widget label doubles as the accessible label
     output_format = st.radio(
-        "Output format",
+        "Select output format:",
         ["WAV", "MP3", "Both"],
         horizontal=True,
         index=0,
@@ -149,109 +395,74 @@ def main():
     )
     
     if convert_button:
+        # Drop the previous result so a failed conversion does not leave stale files on screen
+        st.session_state.pop("conversion", None)
         try:
             # Parse JSON
-            data = json.loads(json_input)
+            data = orjson.loads(json_input)
             
             # Basic validation
             if 'audios' not in data or not isinstance(data['audios'], list) or not data['audios']:
-                st.markdown('<div class="error-message" role="alert">Invalid JSON format. Must contain "audios" array with at least one entry.</div>', unsafe_allow_html=True)
+                st.error('Invalid JSON format. Must contain "audios" array with at least one entry.')
                 return
             
-            # Get the single audio string
-            audio_string = data['audios'][0]
+            # Sarvam returns one base64 string per input segment
+            audio_strings = data['audios']
             
             # Generate filename with timestamp and request_id
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             request_id = data.get('request_id', 'audio').replace('/', '_')
             base_filename = f"{timestamp}_{request_id}"
-            wav_filename = f"audio_files/{base_filename}.wav"
-            
-            # Processing notification for screen readers
-            st.markdown('<div aria-live="assertive">Processing your audio file...</div>', unsafe_allow_html=True)
             
-            # Always save WAV first (even if only MP3 is requested, we need WAV to create MP3)
-            wav_file = save_audio_tts_method(audio_string, wav_filename)
+            with st.spinner("Processing your audio file(s)..."):
+                # Decode every segment, then build all requested formats concurrently on the shared pool
+                executor = conversion_pool()
+                pcms = list(executor.map(decode_pcm, audio_strings))
+                wav_futures = [executor.submit(build_wav, pcm) if output_format in ["WAV", "Both"] else None for pcm in pcms]
+                mp3_futures = [executor.submit(build_mp3, pcm) if output_format in ["MP3", "Both"] else None for pcm in pcms]
+                results = [
+                    (pcm, wav_future.result() if wav_future else None, mp3_future.result() if mp3_future else None)
+                    for pcm, wav_future, mp3_future in zip(pcms, wav_futures, mp3_futures)
+                ]
             
-            # Success message for screen readers
-            st.markdown('<div class="success-message" role="status">Audio conversion successful! You can now play or download your file(s).</div>', unsafe_allow_html=True)
-            
-            # Create two columns for displaying files
-            col1, col2 = st.columns(2)
-            
-            # First column: WAV file (if WAV or Both is selected)
-            if output_format in ["WAV", "Both"]:
-                with col1:
-                    st.markdown('<h2 class="subheader">WAV File</h2>', unsafe_allow_html=True)
-                    
-                    # Display WAV audio player with accessibility attributes
-                    st.markdown('<label for="wav-player">Play WAV audio:</label>', unsafe_allow_html=True)
-                    with open(wav_file, "rb") as f:
-                        wav_bytes = f.read()
-                        st.audio(wav_bytes, format='audio/wav')
-                    
-                    # Download button for WAV with accessible label
-                    with open(wav_file, "rb") as file:
-                        st.download_button(
-                            label="📥 Download WAV File",
-                            data=file,
-                            file_name=os.path.basename(wav_file),
-                            mime="audio/wav",
-                            help="Download the generated WAV file to your device"
-                        )
-            
-            # Second column or first if only MP3 is selected: MP3 file
-            if output_format in ["MP3", "Both"]:
-                with col2 if output_format == "Both" else col1:
-                    st.markdown('<h2 class="subheader">MP3 File</h2>', unsafe_allow_html=True)
-                    
-                    # Convert to MP3
-                    mp3_filename = f"audio_files/{base_filename}.mp3"
-                    mp3_file = convert_to_mp3(wav_file, mp3_filename)
-                    
-                    # Display MP3 audio player with accessibility attributes
-                    st.markdown('<label for="mp3-player">Play MP3 audio:</label>', unsafe_allow_html=True)
-                    with open(mp3_file, "rb") as f:
-                        mp3_bytes = f.read()
-                        st.audio(mp3_bytes, format='audio/mp3')
-                    
-                    # Download button for MP3 with accessible label
-                    with open(mp3_file, "rb") as file:
-                        st.download_button(
-                            label="📥 Download MP3 File",
-                            data=file,
-                            file_name=os.path.basename(mp3_file),
-                            mime="audio/mp3",
-                            key="mp3_download",
-                            help="Download the generated MP3 file to your device"
-                        )
+            # Keep the result across the reruns triggered by the preview toggles
+            st.session_state.conversion = {
+                "results": results,
+                "output_format": output_format,
+                "base_filename": base_filename,
+                # Streaming ids per tab, filled in lazily when a preview is opened
+                "stream_ids": {},
+                # Fresh widget keys per conversion, so preview toggles never carry over to new results
+                "nonce": uuid.uuid4().hex,
+            }
                 
-            # If only MP3 is selected, we can remove the WAV file to save space
-            if output_format == "MP3" and os.path.exists(wav_file):
-                try:
-                    os.remove(wav_file)
-                except:
-                    pass
-                
-        except json.JSONDecodeError:
-            st.markdown('<div class="error-message" role="alert">Invalid JSON format. Please check your input and ensure it is properly formatted.</div>', unsafe_allow_html=True)
+        except orjson.JSONDecodeError:
+            st.error("Invalid JSON format. Please check your input and ensure it is properly formatted.")
         except Exception as e:
-            st.markdown(f'<div class="error-message" role="alert">Error: {str(e)}</div>', unsafe_allow_html=True)
+            st.error(f"Error: {str(e)}")
+    
+    if "conversion" in st.session_state:
+        conversion = st.session_state.conversion
+        results = conversion["results"]
+        st.success("Audio conversion successful! You can now play or download your file(s).")
+        
+        # One tab per segment when the response holds more than one audio
+        if len(results) == 1:
+            display_audio_files(*results[0], conversion["output_format"], conversion["base_filename"], key=f"{conversion['nonce']}_0", stream_ids=conversion["stream_ids"])
+        else:
+            tabs = st.tabs([f"Audio {i + 1}" for i in range(len(results))])
+            for i, (tab, (audio, wav_bytes, mp3_bytes)) in enumerate(zip(tabs, results)):
+                with tab:
+                    display_audio_files(audio, wav_bytes, mp3_bytes, conversion["output_format"], f"{conversion['base_filename']}_{i + 1}", key=f"{conversion['nonce']}_{i}", stream_ids=conversion["stream_ids"])
             
-    # Add hint about expected JSON structure with semantic markup
-    st.markdown("""
-    <div aria-labelledby="json-format-header">
-        <h3 id="json-format-header">Expected Sarvam TTS API Response Format:</h3>
-        <pre aria-label="JSON example format">
-{
+    # Add hint about expected JSON structure
+    st.subheader("Expected Sarvam TTS API Response Format:")
+    st.code("""{
     "request_id": "unique_identifier",
     "audios": [
         "base64_encoded_audio_data"
     ]
-}
-        </pre>
-    </div>
-    """, unsafe_allow_html=True)
+}""", language="json")
     
     # Add information about the Sarvam TTS API with the specific endpoint URL
     st.markdown("""